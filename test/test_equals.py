@@ -1,6 +1,20 @@
 """Test of expression comparison."""
 
-from ufl import Coefficient, Cofunction, FunctionSpace, Mesh, triangle
+from ufl import (
+    Coefficient,
+    Cofunction,
+    FunctionSpace,
+    Mesh,
+    max_value,
+    sin,
+    triangle,
+    variable,
+)
+from ufl.core.compute_expr_hash import (
+    compute_binary_operator_hash,
+    compute_operator_hash,
+    compute_unary_operator_hash,
+)
 from ufl.exprcontainers import ExprList
 from ufl.finiteelement import FiniteElement
 from ufl.pullback import identity_pullback
@@ -103,6 +117,22 @@ def test_comparison_of_sums():
     assert not b == c
 
 
+def test_operator_hash():
+    V = FiniteElement("Lagrange", triangle, 1, (), identity_pullback, H1)
+    domain = Mesh(FiniteElement("Lagrange", triangle, 1, (2,), identity_pullback, H1))
+    v_space = FunctionSpace(domain, V)
+    v = Coefficient(v_space)
+    u = Coefficient(v_space)
+    # Types with a fixed number of operands use a specialised hash,
+    # which must match the generic operator hash
+    for e in (sin(u), u * v, u + v, max_value(u, v), variable(u)):
+        assert hash(e) == compute_operator_hash(e)
+
+    # A wrong num_ops falls back to the generic hash
+    assert compute_binary_operator_hash(sin(u)) == compute_operator_hash(sin(u))
+    assert compute_unary_operator_hash(u * v) == compute_operator_hash(u * v)
+
+
 def test_comparison_of_deeply_nested_expression():
     V = FiniteElement("Lagrange", triangle, 1, (), identity_pullback, H1)
     domain = Mesh(FiniteElement("Lagrange", triangle, 1, (2,), identity_pullback, H1))
@@ -313,6 +313,10 @@ def testCoefficientDerivative():
 
     assert e((3, 7), {f: eval_f}) == (5 * 7**2) ** 2 + (5 * 3 * 2 * 7) ** 2
 
+    evaluate = e.compile_evaluator()
+    for x in [(3, 7), (1, 2), (0, 5)]:
+        assert evaluate(x, {f: eval_f}) == e(x, {f: eval_f})
+
 
 def test_dot():
     domain = Mesh(FiniteElement("Lagrange", triangle, 1, (2,), identity_pullback, H1))
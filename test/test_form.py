@@ -11,6 +11,7 @@ from ufl import (
     TestFunction,
     TrialFunction,
     action,
+    as_ufl,
     derivative,
     dot,
     ds,
@@ -136,6 +137,24 @@ def test_form_domains():
     assert (1 * dx(domain)).ufl_domains() == (domain,)
 
 
+def test_form_geometric_quantities(domain):
+    x = SpatialCoordinate(domain)
+    assert list((x[0] * dx).geometric_quantities()) == [x]
+
+
+def test_form_cache(mass):
+    mass._cache["key"] = 1
+    assert mass._cache == {"key": 1}
+    assert Form([])._cache == {}
+
+
+def test_form_expand_derivatives_cached(stiffness):
+    from ufl.algorithms import expand_derivatives
+
+    expanded = expand_derivatives(stiffness)
+    assert expand_derivatives(stiffness) is expanded
+
+
 def test_form_empty(mass):
     assert not mass.empty()
     assert Form([]).empty()
@@ -151,6 +170,11 @@ def test_form_integrals(mass, boundary_load):
     assert len(boundary_load.integrals_by_type("cell")) == 0
     assert len(boundary_load.integrals_by_type("exterior_facet")) == 1
 
+    (domain,) = mass.ufl_domains()
+    other_domain = Mesh(FiniteElement("Lagrange", triangle, 1, (2,), identity_pullback, H1))
+    assert (mass + boundary_load).integrals_by_domain(domain) == (mass + boundary_load).integrals()
+    assert mass.integrals_by_domain(other_domain) == ()
+
 
 def test_form_call():
     element = FiniteElement("Lagrange", triangle, 1, (), identity_pullback, H1)
@@ -186,6 +210,7 @@ def test_formsum(mass):
     assert len((mass + v + v).components()) == 3
     # Variational forms are summed appropriately
     assert len((mass + v + mass).components()) == 2
+    assert (mass + v + mass).components()[0] == mass + mass
 
     assert v - mass
     assert mass - v
@@ -205,3 +230,14 @@ def test_formsum(mass):
     assert f.weights()[0] == -1
     assert isinstance(df, FormSum)
     assert df.weights()[0] == -9
+
+
+def test_formsum_equals_mixed_weights():
+    element = FiniteElement("Lagrange", triangle, 1, (), identity_pullback, H1)
+    domain = Mesh(FiniteElement("Lagrange", triangle, 1, (2,), identity_pullback, H1))
+    V = FunctionSpace(domain, element)
+    c = Cofunction(V.dual())
+    c2 = Cofunction(V.dual())
+
+    # Python and UFL scalar weights compare equal
+    assert (2 * c + c2).equals(as_ufl(2) * c + c2)
@@ -66,3 +66,15 @@ def test_fixed_indexing_of_expression(x1, x2, x3):
     mi = x000.ufl_operands[1]
     assert len(mi) == 3
     assert mi.indices() == (FixedIndex(0),) * 3
+
+
+def test_product_free_indices(x1, x2):
+    i, j = Index(), Index()
+    a = x2[i, j]
+    p = a * x1[0]
+    assert p.ufl_free_indices is a.ufl_free_indices
+    assert p.ufl_index_dimensions is a.ufl_index_dimensions
+
+    s = x1[i] * x1[i]
+    assert s.ufl_free_indices == ()
+    assert s.ufl_index_dimensions == ()
@@ -41,6 +41,11 @@ def test_float(self):
     assert f2 == f6
     assert f2 == f7
 
+    # Common values are cached
+    assert f3 is f4
+    assert FloatValue(-0.5) is FloatValue(-0.5)
+    assert FloatValue(np.array(1.0)) is f4
+
 
 def test_int(self):
     f1 = as_ufl(1)
@@ -59,6 +64,10 @@ def test_int(self):
     assert f2 == f6  # Division produces a FloatValue
     assert f1 == f7
 
+    # CPython hashes -1 and -2 equally, but the constants do not
+    assert hash(IntValue(-1)) != hash(IntValue(-2))
+    assert hash(FloatValue(-1.0)) != hash(FloatValue(-2.0))
+
 
 def test_complex(self):
     f1 = as_ufl(1 + 1j)
@@ -15,7 +15,7 @@ from ufl.core.ufl_type import ufl_type
 from ufl.index_combination_utils import merge_unique_indices
 from ufl.indexed import Indexed
 from ufl.precedence import parstr
-from ufl.sorting import sorted_expr
+from ufl.sorting import sorted_expr_pair
 
 # --- Algebraic operators ---
 
@@ -75,7 +75,7 @@ class Sum(Operator):
         else:
             # Otherwise sort operands in a canonical order
             # operands = (b, a)
-            a, b = sorted_expr((a, b))
+            a, b = sorted_expr_pair(a, b)
 
         # construct and initialize a new Sum object
         self = Operator.__new__(cls)
@@ -154,7 +154,7 @@ class Product(Operator):
         else:  # a * b = b * a
             # Sort operands in a semi-canonical order
             # (NB! This is fragile! Small changes here can have large effects.)
-            a, b = sorted_expr((a, b))
+            a, b = sorted_expr_pair(a, b)
 
         # Construction
         self = Operator.__new__(cls)
@@ -12,6 +12,7 @@ import warnings
 
 from ufl.algorithms.apply_algebra_lowering import apply_algebra_lowering
 from ufl.algorithms.apply_derivatives import apply_derivatives
+from ufl.form import Form
 
 
 def expand_derivatives(form, **kwargs):
@@ -21,12 +22,21 @@ def expand_derivatives(form, **kwargs):
     equivalent to expr, there are no VariableDerivative
     or CoefficientDerivative objects left, and Grad
     objects have been propagated to Terminal nodes.
+
+    Forms are immutable, so the expanded form is cached on the input
+    form and repeated calls (e.g. from action and adjoint applied to
+    the same form) do not traverse the integrands again.
     """
     # For a deprecation period (I see that dolfin-adjoint passes some
     # args here)
     if kwargs:
         warnings("Deprecation: expand_derivatives no longer takes any keyword arguments")
 
+    if isinstance(form, Form):
+        if form._expanded_derivatives is None:
+            form._expanded_derivatives = apply_derivatives(apply_algebra_lowering(form))
+        return form._expanded_derivatives
+
     # Lower abstractions for tensor-algebra types into index notation
     form = apply_algebra_lowering(form)
 
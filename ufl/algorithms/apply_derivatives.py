@@ -1045,12 +1045,12 @@ class GateauxDerivativeRuleset(GenericDerivativeRuleset):
         # argument(s) s.t. D_w[v](e) = d/dtau e(w+tau v)|tau=0
         self._w = coefficients.ufl_operands
         self._v = arguments.ufl_operands
-        self._w2v = {w: v for w, v in zip(self._w, self._v)}
+        self._w2v = dict(zip(self._w, self._v))
 
         # Build more convenient dict {f: df/dw} for each coefficient f
         # where df/dw is nonzero
         cd = coefficient_derivatives.ufl_operands
-        self._cd = {cd[2 * i]: cd[2 * i + 1] for i in range(len(cd) // 2)}
+        self._cd = dict(zip(cd[::2], cd[1::2]))
 
         # Record the operations delayed to the derivative expansion phase:
         # Example: dN(u)/du where `N` is an ExternalOperator and `u` a Coefficient
@@ -1726,12 +1726,12 @@ class CoordinateDerivativeRuleset(GenericDerivativeRuleset):
         # argument(s) s.t. D_w[v](e) = d/dtau e(w+tau v)|tau=0
         self._w = coefficients.ufl_operands
         self._v = arguments.ufl_operands
-        self._w2v = {w: v for w, v in zip(self._w, self._v)}
+        self._w2v = dict(zip(self._w, self._v))
 
         # Build more convenient dict {f: df/dw} for each coefficient f
         # where df/dw is nonzero
         cd = coefficient_derivatives.ufl_operands
-        self._cd = {cd[2 * i]: cd[2 * i + 1] for i in range(len(cd) // 2)}
+        self._cd = dict(zip(cd[::2], cd[1::2]))
 
     # Explicitly defining dg/dw == 0
     geometric_quantity = GenericDerivativeRuleset.independent_terminal
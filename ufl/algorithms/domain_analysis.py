@@ -19,7 +19,7 @@ from ufl.algorithms.renumbering import renumber_indices
 from ufl.form import Form
 from ufl.integral import Integral
 from ufl.protocols import id_or_none
-from ufl.sorting import cmp_expr, sorted_expr
+from ufl.sorting import cmp_expr, sorted_expr_sum
 from ufl.utils.sorting import canonicalize_metadata, sorted_by_key
 
 
@@ -238,8 +238,7 @@ def accumulate_integrands_with_same_metadata(integrals):
     for cdid in by_cdid:
         integrals, cd = by_cdid[cdid]
         # Ensure canonical sorting of more than two integrands
-        integrands = sorted_expr((itg.integrand() for itg in integrals))
-        integrands_sum = sum(integrands[1:], integrands[0])
+        integrands_sum = sorted_expr_sum(itg.integrand() for itg in integrals)
         by_cdid[cdid] = (integrands_sum, cd)
 
     # Sort integrands canonically by integrand first then compiler
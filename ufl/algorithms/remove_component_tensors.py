@@ -34,6 +34,10 @@ class IndexReplacer(MultiFunction):
 
     def zero(self, o):
         """Handle Zero."""
+        if not o.ufl_free_indices:
+            # Nothing to replace
+            return o
+
         indices = tuple(map(Index, o.ufl_free_indices))
         if not any(i in self.fimap for i in indices):
             # Reuse if untouched
@@ -17,7 +17,8 @@ from ufl.sobolevspace import H1
 
 def is_python_scalar(expression):
     """Return True iff expression is of a Python scalar type."""
-    return isinstance(expression, (int, float, complex))
+    t = type(expression)
+    return t is int or t is float or isinstance(expression, (int, float, complex))
 
 
 def is_ufl_scalar(expression):
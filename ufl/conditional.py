@@ -323,7 +323,7 @@ class Conditional(Operator):
 # --- Specific functions higher level than a conditional ---
 
 
-@ufl_type(is_scalar=True, num_ops=1)
+@ufl_type(is_scalar=True, num_ops=2)
 class MinValue(Operator):
     """Take the minimum of two values."""
 
@@ -352,7 +352,7 @@ class MinValue(Operator):
         return "min_value(%s, %s)" % self.ufl_operands
 
 
-@ufl_type(is_scalar=True, num_ops=1)
+@ufl_type(is_scalar=True, num_ops=2)
 class MaxValue(Operator):
     """Take the maximum of two values."""
 
@@ -222,6 +222,17 @@ class ScalarValue(ConstantValue):
         """Evaluate."""
         return self._value
 
+    def _ufl_compute_hash_(self):
+        """Compute a hash code from the stored Python scalar.
+
+        This avoids formatting the value to a string as the default
+        terminal hash from the repr would do. CPython hashes -1 as -2,
+        so ``value == -1`` is included to keep the common constants
+        -1 and -2 apart.
+        """
+        value = self._value
+        return hash((self._ufl_typecode_, value, value == -1))
+
     def __eq__(self, other):
         """Check equalty.
 
@@ -335,20 +346,41 @@ class FloatValue(RealValue):
 
     __slots__ = ()
 
+    _cache = {}
+
+    # Values generated in bulk by e.g. differentiation
+    _cached_values = frozenset((1.0, -1.0, 0.5, -0.5, 2.0, -2.0))
+
     def __getnewargs__(self):
         """Get new args."""
         return (self._value,)
 
     def __new__(cls, value):
         """Create a new FloatValue."""
+        value = float(value)
         if value == 0.0:
             # Always represent zero with Zero
             return Zero()
-        return ConstantValue.__new__(cls)
+        elif value in FloatValue._cached_values:
+            # Common values are cached to reduce memory usage
+            # (fly-weight pattern)
+            self = FloatValue._cache.get(value)
+            if self is not None:
+                return self
+            self = RealValue.__new__(cls)
+            FloatValue._cache[value] = self
+        else:
+            self = RealValue.__new__(cls)
+        self._init(value)
+        return self
+
+    def _init(self, value):
+        """Initialise."""
+        super(FloatValue, self).__init__(value)
 
     def __init__(self, value):
         """Initialise."""
-        super(FloatValue, self).__init__(float(value))
+        pass
 
     def __repr__(self):
         """Representation."""
@@ -507,6 +539,12 @@ def as_ufl(expression):
     """Converts expression to an Expr if possible."""
     if isinstance(expression, (Expr, ufl.BaseForm)):
         return expression
+    # Exact builtin types first, the numbers ABC checks below are slow
+    t = type(expression)
+    if t is int:
+        return IntValue(expression)
+    elif t is float:
+        return FloatValue(expression)
     elif isinstance(expression, numbers.Integral):
         return IntValue(expression)
     elif isinstance(expression, numbers.Real):
@@ -32,3 +32,35 @@ def compute_expr_hash(expr):
                 expr._hash = expr._ufl_compute_hash_()
             lifo.pop()
     return expr._hash
+
+
+def compute_operator_hash(expr):
+    """Compute a hash code for an operator from its typecode and operand hashes."""
+    return hash((expr._ufl_typecode_, *map(hash, expr.ufl_operands)))
+
+
+def compute_unary_operator_hash(expr):
+    """Compute the same hash as compute_operator_hash for an operator with one operand."""
+    ops = expr.ufl_operands
+    if len(ops) != 1:
+        # The type declared the wrong num_ops, use the generic hash
+        return compute_operator_hash(expr)
+    return hash((expr._ufl_typecode_, hash(ops[0])))
+
+
+def compute_binary_operator_hash(expr):
+    """Compute the same hash as compute_operator_hash for an operator with two operands."""
+    ops = expr.ufl_operands
+    if len(ops) != 2:
+        # The type declared the wrong num_ops, use the generic hash
+        return compute_operator_hash(expr)
+    a, b = ops
+    return hash((expr._ufl_typecode_, hash(a), hash(b)))
+
+
+# Default operator hash functions, by the number of operands they are
+# specialised for
+operator_hash_functions = {
+    1: compute_unary_operator_hash,
+    2: compute_binary_operator_hash,
+}
@@ -8,6 +8,7 @@
 # Modified by Anders Logg, 2008
 # Modified by Massimiliano Leoni, 2016
 
+from ufl.core.compute_expr_hash import compute_operator_hash
 from ufl.core.expr import Expr
 from ufl.core.ufl_type import ufl_type
 
@@ -26,6 +27,8 @@ class Operator(Expr):
         # get around some tricky too-fancy __new__/__init__ design in
         # algebra.py, for now.  It would be nicer to make the classes
         # in algebra.py pass operands here.
+        # Operands must be given as a tuple, which equality, hashing
+        # and the traversal algorithms rely on without copying.
         if operands is not None:
             self.ufl_operands = operands
 
@@ -37,9 +40,10 @@ class Operator(Expr):
         """Get UFL signature data."""
         return self._ufl_typecode_
 
-    def _ufl_compute_hash_(self):
-        """Compute a hash code for this expression. Used by sets and dicts."""
-        return hash((self._ufl_typecode_, *map(hash, self.ufl_operands)))
+    # Compute a hash code for this expression. Used by sets and dicts.
+    # ufl_type replaces this with a specialised version for types with a
+    # fixed number of operands.
+    _ufl_compute_hash_ = compute_operator_hash
 
     def __repr__(self):
         """Default repr string construction for operators."""
@@ -14,7 +14,11 @@ import typing
 from abc import ABC, abstractmethod
 
 import ufl.core as core
-from ufl.core.compute_expr_hash import compute_expr_hash
+from ufl.core.compute_expr_hash import (
+    compute_expr_hash,
+    compute_operator_hash,
+    operator_hash_functions,
+)
 from ufl.utils.formatting import camel2underscore
 
 
@@ -377,6 +381,14 @@ def ufl_type(
         if use_default_hash:
             cls.__hash__ = compute_expr_hash
 
+        # Types using the default operator hash get a version which
+        # reads a fixed number of operands directly, if num_ops is known
+        if (
+            cls._ufl_compute_hash_ is compute_operator_hash
+            or cls._ufl_compute_hash_ in operator_hash_functions.values()
+        ):
+            cls._ufl_compute_hash_ = operator_hash_functions.get(_num_ops, compute_operator_hash)
+
         # NB! This function conditionally adds some methods to the
         # class!  This approach significantly reduces the amount of
         # small functions to implement across all the types but of
@@ -322,22 +322,39 @@ def _restrict(self, side):
     raise ValueError(f"Invalid side '{side}' in restriction operator.")
 
 
-def _eval(self, coord, mapping=None, component=()):
-    """Evaluate.
+def _compile_evaluator(self):
+    """Return a function evaluating this expression at a coordinate.
 
-    Evaluate expression at this particular coordinate, with provided
-    values for other terminals in mapping.
+    Derivatives are expanded once when the function is created, so
+    evaluating the same expression at many points only pays for the
+    evaluation itself. The returned function takes the arguments
+    ``(coord, mapping=None, component=())`` like calling the expression.
     """
     # Evaluate derivatives first
     from ufl.algorithms import expand_derivatives
 
     f = expand_derivatives(self)
 
-    # Evaluate recursively
-    if mapping is None:
-        mapping = {}
-    index_values = StackDict()
-    return f.evaluate(coord, mapping, component, index_values)
+    def evaluate(coord, mapping=None, component=()):
+        # Evaluate recursively
+        if mapping is None:
+            mapping = {}
+        index_values = StackDict()
+        return f.evaluate(coord, mapping, component, index_values)
+
+    return evaluate
+
+
+Expr.compile_evaluator = _compile_evaluator
+
+
+def _eval(self, coord, mapping=None, component=()):
+    """Evaluate.
+
+    Evaluate expression at this particular coordinate, with provided
+    values for other terminals in mapping.
+    """
+    return _compile_evaluator(self)(coord, mapping, component)
 
 
 def _call(self, arg, mapping=None, component=()):
@@ -21,7 +21,7 @@ from ufl.constant import Constant
 from ufl.constantvalue import Zero
 from ufl.core.expr import Expr, ufl_err_str
 from ufl.core.ufl_type import UFLType, ufl_type
-from ufl.domain import extract_unique_domain, sort_domains
+from ufl.domain import extract_unique_domain, join_domains, sort_domains
 from ufl.equation import Equation
 from ufl.integral import Integral
 from ufl.utils.counted import Counted
@@ -240,20 +240,24 @@ class Form(BaseForm):
         "_arguments",
         "_base_form_operators",
         # --- Dict that external frameworks can place framework-specific
-        #     data in to be carried with the form
+        #     data in to be carried with the form, created on first
+        #     access through the _cache property
         #     Never use this internally in ufl!
-        "_cache",
+        "_cache_data",
         "_coefficient_numbering",
         "_coefficients",
         "_constant_numbering",
         "_constants",
         "_domain_numbering",
+        "_expanded_derivatives",
         "_geometric_quantities",
         "_hash",
         # --- List of Integral objects (a Form is a sum of these
         # Integrals, everything else is derived)
         "_integrals",
         # --- Internal variables for caching various data
+        "_integrals_by_domain",
+        "_integrals_by_type",
         "_integration_domains",
         "_signature",
         "_subdomain_data",
@@ -272,6 +276,11 @@ class Form(BaseForm):
         # stability
         self._integrals = _sorted_integrals(integrals)
 
+        # Internal variables for caching integrals grouped by type and
+        # by domain
+        self._integrals_by_type = None
+        self._integrals_by_domain = None
+
         # Internal variables for caching domain data
         self._integration_domains = None
         self._domain_numbering = None
@@ -281,24 +290,41 @@ class Form(BaseForm):
 
         # Internal variables for caching form argument data
         self._coefficients = None
+        self._geometric_quantities = None
         self._coefficient_numbering = None
+        self._constants = None
         self._constant_numbering = None
         self._terminal_numbering = None
 
         # Internal variables for caching base form operator data
         self._base_form_operators = None
 
-        from ufl.algorithms.analysis import extract_constants
-
-        self._constants = extract_constants(self)
-
         # Internal variables for caching of hash and signature after
         # first request
         self._hash = None
         self._signature = None
 
+        # Internal variable for caching the result of expand_derivatives
+        self._expanded_derivatives = None
+
         # Never use this internally in ufl!
-        self._cache = {}
+        self._cache_data = None
+
+    @property
+    def _cache(self):
+        """Dict that external frameworks can place framework-specific data in.
+
+        Most forms never use it, so it is only allocated on first access.
+        Never use this internally in ufl!
+        """
+        if self._cache_data is None:
+            self._cache_data = {}
+        return self._cache_data
+
+    @_cache.setter
+    def _cache(self, value):
+        """Replace the framework-specific data dict."""
+        self._cache_data = value
 
     # --- Accessor interface ---
 
@@ -308,13 +334,15 @@ class Form(BaseForm):
 
     def integrals_by_type(self, integral_type):
         """Return a sequence of all integrals with a particular domain type."""
-        return tuple(
-            integral for integral in self.integrals() if integral.integral_type() == integral_type
-        )
+        if self._integrals_by_type is None:
+            self._analyze_integrals()
+        return self._integrals_by_type.get(integral_type, ())
 
     def integrals_by_domain(self, domain):
         """Return a sequence of all integrals with a particular integration domain."""
-        return tuple(integral for integral in self.integrals() if integral.ufl_domain() == domain)
+        if self._integrals_by_domain is None:
+            self._analyze_integrals()
+        return self._integrals_by_domain.get(domain, ())
 
     def empty(self):
         """Returns whether the form has no integrals."""
@@ -388,6 +416,8 @@ class Form(BaseForm):
 
     def constants(self):
         """Get constants."""
+        if self._constants is None:
+            self._analyze_constants()
         return self._constants
 
     def constant_numbering(self):
@@ -445,6 +475,8 @@ class Form(BaseForm):
         """Evaluate ``bool(lhs_form == rhs_form)``."""
         if type(other) is not Form:
             return False
+        if self is other:
+            return True
         if len(self._integrals) != len(other._integrals):
             return False
         if hash(self) != hash(other):
@@ -585,10 +617,18 @@ class Form(BaseForm):
 
     # --- Analysis functions, precomputation and caching of various quantities
 
+    def _analyze_integrals(self):
+        """Group integrals by integral type and by integration domain."""
+        by_type = defaultdict(list)
+        by_domain = defaultdict(list)
+        for integral in self._integrals:
+            by_type[integral.integral_type()].append(integral)
+            by_domain[integral.ufl_domain()].append(integral)
+        self._integrals_by_type = {k: tuple(v) for k, v in by_type.items()}
+        self._integrals_by_domain = {k: tuple(v) for k, v in by_domain.items()}
+
     def _analyze_domains(self):
         """Analyze domains."""
-        from ufl.domain import join_domains, sort_domains
-
         # Collect integration domains.
         self._integration_domains = sort_domains(
             join_domains([itg.ufl_domain() for itg in self._integrals])
@@ -647,6 +687,12 @@ class Form(BaseForm):
         base_form_ops = extract_base_form_operators(self)
         self._base_form_operators = tuple(sorted(base_form_ops, key=lambda x: x.count()))
 
+    def _analyze_constants(self):
+        """Analyze which Constant objects can be found in the form."""
+        from ufl.algorithms.analysis import extract_constants
+
+        self._constants = extract_constants(self)
+
     def _compute_renumbering(self):
         """Compute renumbering."""
         dn = self.domain_numbering()
@@ -732,7 +778,7 @@ class FormSum(BaseForm):
         self._weights = weights
         self._components = full_components
         self._sum_variational_components()
-        self.ufl_operands = self._components
+        self.ufl_operands = tuple(self._components)
 
     def components(self):
         """Get components."""
@@ -744,20 +790,22 @@ class FormSum(BaseForm):
 
     def _sum_variational_components(self):
         """Sum variational components."""
-        var_forms = None
+        # Collect the integrals of all variational forms and build a
+        # single Form at the end, rather than adding one form at a time
+        # which sorts the accumulated integrals again for every term
+        var_integrals = None
         other_components = []
         new_weights = []
         for i, component in enumerate(self._components):
             if isinstance(component, Form):
-                if var_forms:
-                    var_forms = var_forms + (self._weights[i] * component)
-                else:
-                    var_forms = self._weights[i] * component
+                if var_integrals is None:
+                    var_integrals = []
+                var_integrals.extend((self._weights[i] * component).integrals())
             else:
                 other_components.append(component)
                 new_weights.append(self._weights[i])
-        if var_forms:
-            other_components.insert(0, var_forms)
+        if var_integrals is not None:
+            other_components.insert(0, Form(var_integrals))
             new_weights.insert(0, 1)
         self._components = other_components
         self._weights = new_weights
@@ -775,8 +823,6 @@ class FormSum(BaseForm):
 
     def _analyze_domains(self):
         """Analyze which domains can be found in FormSum."""
-        from ufl.domain import join_domains, sort_domains
-
         # Collect unique domains
         self._domains = sort_domains(
             join_domains(chain.from_iterable(c.ufl_domains() for c in self.components()))
@@ -853,6 +899,8 @@ class ZeroBaseForm(BaseForm):
     def __init__(self, arguments):
         """Initialise."""
         BaseForm.__init__(self)
+        # Operands are always stored as a tuple, see Expr.ufl_operands
+        arguments = tuple(arguments)
         self._arguments = arguments
         self.ufl_operands = arguments
         self._hash = None
@@ -866,8 +914,6 @@ class ZeroBaseForm(BaseForm):
 
     def _analyze_domains(self):
         """Analyze which domains can be found in ZeroBaseForm."""
-        from ufl.domain import join_domains, sort_domains
-
         # Collect unique domains
         self._domains = sort_domains(
             join_domains(chain.from_iterable(e.ufl_domains() for e in self.ufl_operands))
@@ -183,6 +183,12 @@ def merge_nonoverlapping_indices(a, b):
     aid = a.ufl_index_dimensions
     bid = b.ufl_index_dimensions
 
+    # Free indices of each operand are already sorted and unique
+    if not bi:
+        return ai, aid
+    elif not ai:
+        return bi, bid
+
     # Merge lists to return
     s = sorted(zip(ai + bi, aid + bid))
     if s:
@@ -203,6 +209,12 @@ def merge_overlapping_indices(afi, afid, bfi, bfid):
       C[j,r] := A[i,j,k] * B[i,r,k]
       A, B -> (j,r), (jdim,rdim), (i,k), (idim,kdim)
     """
+    # Nothing can be repeated if either operand has no free indices
+    if not bfi:
+        return afi, afid, (), ()
+    elif not afi:
+        return bfi, bfid, (), ()
+
     # Extract input properties
     an = len(afi)
     bn = len(bfi)
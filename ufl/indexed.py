@@ -15,6 +15,32 @@ from ufl.index_combination_utils import unique_sorted_indices
 from ufl.precedence import parstr
 
 
+def _indexed_free_indices(expression, multiindex):
+    """Return the free index ids and dimensions of ``expression[multiindex]``.
+
+    The tuples of the expression are reused when no free indices are
+    added.
+    """
+    efi = expression.ufl_free_indices
+    efid = expression.ufl_index_dimensions
+    if not any(isinstance(ind, Index) for ind in multiindex):
+        # Only fixed indices, the free indices of the expression
+        # are already sorted and unique
+        return efi, efid
+
+    shape = expression.ufl_shape
+    fi = list(zip(efi, efid))
+    for pos, ind in enumerate(multiindex):
+        if isinstance(ind, Index):
+            fi.append((ind.count(), shape[pos]))
+    fi = unique_sorted_indices(sorted(fi))
+    if fi:
+        fi, fid = zip(*fi)
+    else:
+        fi, fid = (), ()
+    return fi, fid
+
+
 @ufl_type(is_shaping=True, num_ops=2, is_terminal_modifier=True)
 class Indexed(Operator):
     """Indexed expression."""
@@ -31,18 +57,7 @@ class Indexed(Operator):
             return expression
         if isinstance(expression, Zero):
             # Zero-simplify indexed Zero objects
-            shape = expression.ufl_shape
-            efi = expression.ufl_free_indices
-            efid = expression.ufl_index_dimensions
-            fi = list(zip(efi, efid))
-            for pos, ind in enumerate(multiindex):
-                if isinstance(ind, Index):
-                    fi.append((ind.count(), shape[pos]))
-            fi = unique_sorted_indices(sorted(fi))
-            if fi:
-                fi, fid = zip(*fi)
-            else:
-                fi, fid = (), ()
+            fi, fid = _indexed_free_indices(expression, multiindex)
             return Zero(shape=(), free_indices=fi, index_dimensions=fid)
 
         try:
@@ -83,17 +98,7 @@ class Indexed(Operator):
             raise ValueError("Fixed index out of range!")
 
         # Build tuples of free index ids and dimensions
-        efi = expression.ufl_free_indices
-        efid = expression.ufl_index_dimensions
-        fi = list(zip(efi, efid))
-        for pos, ind in enumerate(multiindex):
-            if isinstance(ind, Index):
-                fi.append((ind.count(), shape[pos]))
-        fi = unique_sorted_indices(sorted(fi))
-        if fi:
-            fi, fid = zip(*fi)
-        else:
-            fi, fid = (), ()
+        fi, fid = _indexed_free_indices(expression, multiindex)
 
         # Cache free index and dimensions
         self.ufl_free_indices = fi
@@ -22,6 +22,7 @@ class Integral(object):
     """An integral over a single domain."""
 
     __slots__ = (
+        "_hash",
         "_integral_type",
         "_integrand",
         "_metadata",
@@ -40,6 +41,7 @@ class Integral(object):
         self._subdomain_id = subdomain_id
         self._metadata = metadata
         self._subdomain_data = subdomain_data
+        self._hash = None
 
     def reconstruct(
         self,
@@ -144,11 +146,13 @@ class Integral(object):
         # Assuming few collisions by ignoring hash(self._metadata) (a
         # dict is not hashable but we assume it is immutable in
         # practice)
-        hashdata = (
-            hash(self._integrand),
-            self._integral_type,
-            hash(self._ufl_domain),
-            self._subdomain_id,
-            id_or_none(self._subdomain_data),
-        )
-        return hash(hashdata)
+        if self._hash is None:
+            hashdata = (
+                hash(self._integrand),
+                self._integral_type,
+                hash(self._ufl_domain),
+                self._subdomain_id,
+                id_or_none(self._subdomain_data),
+            )
+            self._hash = hash(hashdata)
+        return self._hash
@@ -180,10 +180,28 @@ def sorted_expr(sequence):
     return sorted(sequence, key=cmp_to_key(cmp_expr))
 
 
+def sorted_expr_pair(a, b):
+    """Return a canonically sorted tuple of the two Expr objects a and b.
+
+    Equivalent to ``tuple(sorted_expr((a, b)))`` without the overhead
+    of the general sort, for use in operator constructors.
+    """
+    if cmp_expr(b, a) < 0:
+        return b, a
+    return a, b
+
+
 def sorted_expr_sum(seq):
-    """Sorted expr sum."""
-    seq2 = sorted(seq, key=cmp_to_key(cmp_expr))
-    s = seq2[0]
-    for e in seq2[1:]:
-        s = s + e
-    return s
+    """Sorted expr sum.
+
+    Terms are added pairwise to build a balanced tree of sums. Adding
+    terms one by one to a growing sum gives quadratic cost, as each new
+    ``Sum`` compares its operands canonically.
+    """
+    terms = sorted(seq, key=cmp_to_key(cmp_expr))
+    while len(terms) > 1:
+        pairs = [terms[i] + terms[i + 1] for i in range(0, len(terms) - 1, 2)]
+        if len(terms) % 2:
+            pairs.append(terms[-1])
+        terms = pairs
+    return terms[0]
@@ -11,7 +11,7 @@ from ufl.core.expr import ufl_err_str
 from ufl.core.ufl_type import ufl_type
 from ufl.index_combination_utils import merge_nonoverlapping_indices
 from ufl.precedence import parstr
-from ufl.sorting import sorted_expr
+from ufl.sorting import sorted_expr_pair
 
 # Algebraic operations on tensors:
 # FloatValues:
@@ -174,7 +174,7 @@ class Inner(CompoundTensorOperator):
         # sort operands for unique representation,
         # must be independent of various counts etc.
         # as explained in cmp_expr
-        if (a, b) != tuple(sorted_expr((a, b))):
+        if sorted_expr_pair(a, b) != (a, b):
             return Conj(Inner(b, a))
 
         return CompoundTensorOperator.__new__(cls)